@@ -50,6 +50,13 @@ async def get_current_user(
     return {"_id": str(user["_id"]), "email": user["email"]}
 
 
+async def require_admin(user=Depends(get_current_user)):
+    admins = {e.strip().lower() for e in settings.ADMIN_EMAILS.split(",") if e.strip()}
+    if user["email"].lower() not in admins:
+        raise HTTPException(status_code=403, detail="Admin only")
+    return user
+
+
 # --------- Routes ---------
 @router.post("/register")
 async def register(user: UserCreate):
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Finance Analytics
+- Monthly aggregation of finance records (income, debt, savings)
+- Rolling averages, month-over-month deltas
+- Debt payoff projection, savings-goal ETA
+All computations are vectorized pandas/NumPy (O(N), no row loops).
+Used by streamlit_app.py and the FastAPI /finance router.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent
+CONFIG_PATH = Path(os.getenv("FINANCE_CONFIG", ROOT.parent / "data" / "finance_config.json"))
+
+DEFAULT_CONFIG = {"initial_debt": 0.0, "goal_monthly_income": 0.0}
+NUMERIC_COLS = ["income", "debt", "savings"]
+
+
+# ---------- Input ----------
+def load_config(path: Path | str | None = None) -> dict:
+    """Read finance_config.json; missing file/keys fall back to zeros."""
+    cfg = dict(DEFAULT_CONFIG)
+    p = Path(path) if path else CONFIG_PATH
+    if p.exists():
+        cfg.update(json.loads(p.read_text(encoding="utf-8")))
+    return {k: float(cfg[k]) for k in DEFAULT_CONFIG}
+
+
+def to_frame(docs: list[dict]) -> pd.DataFrame:
+    """Mongo docs -> DataFrame with naive `ts` and numeric income/debt/savings."""
+    if not docs:
+        return pd.DataFrame()
+    df = pd.DataFrame(docs).copy()
+
+    # Normalize timestamp column (handles both str and datetime)
+    if "ts" in df.columns:
+        df["ts"] = pd.to_datetime(df["ts"], errors="coerce", utc=True).dt.tz_convert(None)
+    else:
+        df["ts"] = pd.NaT
+
+    # Ensure numeric columns exist
+    for col in NUMERIC_COLS:
+        if col not in df.columns:
+            df[col] = 0.0
+        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0.0)
+
+    return df.sort_values("ts").reset_index(drop=True)
+
+
+def watermark(df: pd.DataFrame) -> tuple[int, str]:
+    """Cache key for a finance series: (row count, newest _id).
+
+    Records are append-only, so the pair changes whenever new data lands.
+    """
+    if df.empty:
+        return 0, ""
+    last = str(df["_id"].max()) if "_id" in df.columns else str(df["ts"].max())
+    return len(df), last
+
+
+# ---------- Analytics ----------
+def current_month() -> pd.Period:
+    return pd.Timestamp.now().to_period("M")
+
+
+def monthly(
+    df: pd.DataFrame, window: int = 3, through: pd.Period | None = None
+) -> pd.DataFrame:
+    """Per-month totals with rolling averages and month-over-month deltas.
+
+    income/savings are summed per month, debt is the month's last balance.
+    Months without records, up to `through` (if later than the data), are
+    filled in (0 income/savings, debt carried forward) so rolling windows
+    and deltas span calendar months, not rows.
+    """
+    cols = [
+        "income", "savings", "debt",
+        "income_avg", "savings_avg", "paydown_avg",
+        "income_mom", "income_mom_pct", "savings_mom", "debt_mom",
+        "savings_total",
+    ]
+    if df.empty or not df["ts"].notna().any():
+        return pd.DataFrame(columns=cols, index=pd.PeriodIndex([], freq="M", name="month"))
+
+    d = df[df["ts"].notna()]
+    g = d.groupby(d["ts"].dt.to_period("M").rename("month"), sort=True)
+    m = pd.DataFrame(
+        {
+            "income": g["income"].sum(),
+            "savings": g["savings"].sum(),
+            "debt": g["debt"].last(),
+        }
+    )
+    end = max(m.index.max(), through) if through is not None else m.index.max()
+    months = pd.period_range(m.index.min(), end, freq="M", name="month")
+    m = m.reindex(months)
+    m[["income", "savings"]] = m[["income", "savings"]].fillna(0.0)
+    m["debt"] = m["debt"].ffill()
+
+    roll = m[["income", "savings"]].rolling(window, min_periods=1).mean()
+    m["income_avg"] = roll["income"]
+    m["savings_avg"] = roll["savings"]
+
+    delta = m[["income", "savings", "debt"]].diff()
+    m["income_mom"] = delta["income"]
+    m["savings_mom"] = delta["savings"]
+    m["debt_mom"] = delta["debt"]
+    m["income_mom_pct"] = (
+        m["income"].pct_change(fill_method=None).replace([np.inf, -np.inf], np.nan)
+    )
+    m["paydown_avg"] = (-delta["debt"]).rolling(window, min_periods=1).mean() + 0.0  # no -0.0
+    m["savings_total"] = m["savings"].cumsum()
+    return m[cols]
+
+
+def _months_to(remaining: float, rate: float) -> int | None:
+    if remaining <= 0:
+        return 0
+    if not np.isfinite(rate) or rate <= 0:
+        return None
+    return int(np.ceil(remaining / rate))
+
+
+def _shift(period: pd.Period | None, months: int | None) -> str | None:
+    if period is None or months is None:
+        return None
+    return str(period + months)
+
+
+def analyze(
+    df: pd.DataFrame,
+    savings_goal: float,
+    config: dict | None = None,
+    window: int = 3,
+    horizon: int = 24,
+    as_of: pd.Period | None = None,
+) -> dict:
+    """Summary KPIs, monthly table and a `horizon`-month projection.
+
+    Rates, ETAs and the projection are anchored at `as_of` (default: the
+    current month), so a gap since the last record counts as months with
+    no savings/paydown instead of the ETAs silently drifting into the past.
+    """
+    cfg = config or load_config()
+    as_of = as_of or current_month()
+    m = monthly(df, window, through=as_of)
+
+    savings_total = float(df["savings"].sum()) if not df.empty else 0.0
+    last_month = m.index[-1] if len(m) else None
+    if len(m):
+        debt_last = float(m["debt"].iloc[-1])
+    else:
+        debt_last = float(df["debt"].iloc[-1]) if not df.empty else 0.0
+    savings_rate = float(m["savings_avg"].iloc[-1]) if len(m) else np.nan
+    paydown_rate = float(m["paydown_avg"].iloc[-1]) if len(m) else np.nan
+    income_avg = float(m["income_avg"].iloc[-1]) if len(m) else np.nan
+
+    savings_eta = _months_to(savings_goal - savings_total, savings_rate)
+    debt_eta = _months_to(debt_last, paydown_rate)
+
+    initial_debt = cfg["initial_debt"]
+    goal_income = cfg["goal_monthly_income"]
+    has_ts = not df.empty and df["ts"].notna().any()
+    summary = {
+        "as_of": str(as_of),
+        "last_record_month": str(df["ts"].max().to_period("M")) if has_ts else None,
+        "records": int(len(df)),
+        "months": int(len(m)),
+        "savings_total": savings_total,
+        "savings_goal": float(savings_goal),
+        "savings_progress": min(savings_total / max(savings_goal, 1.0), 1.0),
+        "savings_rate": savings_rate,
+        "savings_goal_months": savings_eta,
+        "savings_goal_eta": _shift(last_month, savings_eta),
+        "debt": debt_last,
+        "initial_debt": initial_debt,
+        "debt_paid_pct": (
+            (initial_debt - debt_last) / initial_debt if initial_debt and len(df) else None
+        ),
+        "debt_paydown_rate": paydown_rate,
+        "debt_free_months": debt_eta,
+        "debt_free_eta": _shift(last_month, debt_eta),
+        "income_avg": income_avg,
+        "goal_monthly_income": goal_income,
+        "income_goal_ratio": income_avg / goal_income if goal_income else None,
+    }
+
+    if last_month is None:
+        projection = pd.DataFrame(
+            columns=["debt", "savings_total"],
+            index=pd.PeriodIndex([], freq="M", name="month"),
+        )
+    else:
+        steps = np.arange(1, horizon + 1)
+        rate = paydown_rate if paydown_rate > 0 else 0.0
+        projection = pd.DataFrame(
+            {
+                "debt": np.maximum(debt_last - rate * steps, 0.0),
+                "savings_total": savings_total + np.nan_to_num(savings_rate) * steps,
+            },
+            index=pd.period_range(last_month + 1, periods=horizon, freq="M", name="month"),
+        )
+
+    return {"summary": summary, "monthly": m, "projection": projection}
+
+
+# ---------- Output ----------
+def _records(frame: pd.DataFrame) -> list[dict]:
+    out = frame.reset_index()
+    out["month"] = out["month"].astype(str)
+    out = out.astype(object).where(out.notna(), None)
+    return out.to_dict("records")
+
+
+def to_payload(result: dict) -> dict:
+    """JSON-safe version of analyze() output (NaN -> None, Period -> 'YYYY-MM')."""
+    summary = {
+        k: (None if isinstance(v, float) and not np.isfinite(v) else v)
+        for k, v in result["summary"].items()
+    }
+    return {
+        "summary": summary,
+        "monthly": _records(result["monthly"]),
+        "projection": _records(result["projection"]),
+    }
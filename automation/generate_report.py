@@ -1,9 +1,49 @@
 #!/usr/bin/env python3
-"""Temporary clean stub for report generator (linters-friendly)."""
+"""Finance report PDF builder (ReportLab).
+
+`build_pdf` is used by the API's scheduled finance_report job; the
+standalone CLI generator is still disabled.
+"""
 
 from __future__ import annotations
+
+from datetime import datetime
 from pathlib import Path
 
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import Image, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+TABLE_STYLE = TableStyle(
+    [
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
+        ("ALIGN", (1, 1), (1, -1), "RIGHT"),
+    ]
+)
+
+
+def _fmt(value) -> str:
+    if value is None or (isinstance(value, float) and value != value):
+        return "—"
+    if isinstance(value, float):
+        return f"{value:,.2f}" if abs(value) < 10 else f"{value:,.0f}"
+    if isinstance(value, int):
+        return f"{value:,}"
+    return str(value)
+
+
+def _table(title: str, rows: dict) -> Table:
+    data = [[title, "Value"]] + [
+        [k.replace("_", " ").capitalize(), _fmt(v)] for k, v in rows.items()
+    ]
+    t = Table(data, hAlign="LEFT", colWidths=[220, 220])
+    t.setStyle(TABLE_STYLE)
+    return t
+
 
 def build_pdf(
     summary: dict,
@@ -11,9 +51,23 @@ def build_pdf(
     pdf_path: Path,
     goal_block: dict | None = None,
 ) -> None:
-    """No-op placeholder; writes a tiny placeholder PDF header."""
+    """Chart + summary table (+ optional goal table) -> A4 PDF at `pdf_path`."""
     pdf_path.parent.mkdir(parents=True, exist_ok=True)
-    pdf_path.write_bytes(b"%PDF-1.4\n% placeholder\n")
+    styles = getSampleStyleSheet()
+    story = [
+        Paragraph("ProPlus Finance Report", styles["Title"]),
+        Spacer(1, 8),
+        Paragraph(f"Generated: {datetime.now():%Y-%m-%d %H:%M}", styles["Normal"]),
+        Spacer(1, 16),
+    ]
+    if Path(chart_path).exists():
+        story += [Image(str(chart_path), width=500, height=310), Spacer(1, 18)]
+    story += [_table("Metric", summary), Spacer(1, 12)]
+    if goal_block:
+        story += [_table("Savings goal", goal_block), Spacer(1, 12)]
+    story.append(Paragraph("Generated by ProPlus", styles["Italic"]))
+
+    SimpleDocTemplate(str(pdf_path), pagesize=A4).build(story)
 
 
 def main() -> None:
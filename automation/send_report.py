@@ -13,6 +13,7 @@ EMAIL_PASS = os.getenv("EMAIL_PASS")
 EMAIL_TO = [e.strip() for e in os.getenv("EMAIL_TO", "").split(",") if e.strip()]
 SMTP_HOST = os.getenv("SMTP_HOST", "smtp.gmail.com")
 SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
+SMTP_TIMEOUT = float(os.getenv("SMTP_TIMEOUT", "30"))
 REPORTS_DIR = os.getenv("REPORTS_DIR", "../data_analytics/reports")
 
 
@@ -21,40 +22,57 @@ def latest(mask):
     return max(files, key=os.path.getmtime) if files else None
 
 
-def build_and_send():
-    print(f"FROM: {EMAIL_USER}")
-    print(f"TO  : {EMAIL_TO}")
-    print(f"SMTP: {SMTP_HOST}:{SMTP_PORT}")
-
-    png = latest(os.path.join(REPORTS_DIR, "finance_report.png"))
-    pdf = latest(os.path.join(REPORTS_DIR, "finance_report.pdf"))
-    summary = latest(os.path.join(REPORTS_DIR, "finance_summary_*.pdf"))
-    print("Attachments:", [x for x in [summary, pdf, png] if x])
-
+def build_message(files, subject=None):
     msg = EmailMessage()
-    msg["Subject"] = f"Finance Report – {datetime.now():%Y-%m-%d}"
+    msg["Subject"] = subject or f"Finance Report – {datetime.now():%Y-%m-%d}"
     msg["From"] = EMAIL_USER
     msg["To"] = ", ".join(EMAIL_TO)
     msg.set_content("Կցված են վերջին հաշվետվությունների PDF/PNG ֆայլերը։")
 
-    for f in [summary, pdf, png]:
+    for f in files:
         if not f:
             continue
         with open(f, "rb") as fp:
             data = fp.read()
         maintype, subtype = (
-            ("application", "pdf") if f.endswith(".pdf") else ("image", "png")
+            ("application", "pdf") if str(f).endswith(".pdf") else ("image", "png")
         )
         msg.add_attachment(
             data, maintype=maintype, subtype=subtype, filename=os.path.basename(f)
         )
+    return msg
 
-    try:
-        with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as s:
+
+def send_message(msg, debug=False, before_send=None):
+    """Send via SMTP; raises on failure (callers decide how to report it).
+
+    `before_send` is called after connect/STARTTLS/login succeeded, right
+    before the message is handed over: failures before it are safe to retry.
+    """
+    with smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=SMTP_TIMEOUT) as s:
+        if debug:
             s.set_debuglevel(1)  # 🔍 SMTP debug to console
-            s.starttls()
-            s.login(EMAIL_USER, EMAIL_PASS)
-            s.send_message(msg)
+        s.starttls()
+        s.login(EMAIL_USER, EMAIL_PASS)
+        if before_send:
+            before_send()
+        s.send_message(msg)
+
+
+def build_and_send():
+    print(f"FROM: {EMAIL_USER}")
+    print(f"TO  : {EMAIL_TO}")
+    print(f"SMTP: {SMTP_HOST}:{SMTP_PORT}")
+
+    png = latest(os.path.join(REPORTS_DIR, "finance_report.png"))
+    pdf = latest(os.path.join(REPORTS_DIR, "finance_report.pdf"))
+    summary = latest(os.path.join(REPORTS_DIR, "finance_summary_*.pdf"))
+    print("Attachments:", [x for x in [summary, pdf, png] if x])
+
+    msg = build_message([summary, pdf, png])
+
+    try:
+        send_message(msg, debug=True)
         print("✅ SENT")
     except Exception as e:
         print("❌ SEND FAILED:", e)
@@ -10,6 +10,8 @@ from pymongo import MongoClient
 from bson.objectid import ObjectId
 import streamlit as st
 
+import finance_analytics as fa
+
 # ---------- Settings ----------
 MONGO_URI = os.getenv("MONGO_URI", "mongodb://mongo:27017")
 MONGO_DB = os.getenv("MONGO_DB", "proplus")
@@ -30,29 +32,16 @@ collection = get_collection()
 
 
 # ---------- Helpers ----------
-def _to_df(docs: list[dict]) -> pd.DataFrame:
-    if not docs:
-        return pd.DataFrame()
-    df = pd.DataFrame(docs).copy()
-
-    # Normalize timestamp column
-    if "ts" in df.columns:
-        # handle both str and datetime
-        df["ts"] = pd.to_datetime(df["ts"], errors="coerce", utc=True).dt.tz_convert(
-            None
-        )
-    else:
-        df["ts"] = pd.NaT
-
-    # Ensure numeric columns exist
-    for col in ["income", "debt", "savings"]:
-        if col not in df.columns:
-            df[col] = 0.0
-        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0.0)
-
-    # Sort by time
-    df = df.sort_values("ts").reset_index(drop=True)
-    return df
+@st.cache_data(show_spinner=False)
+def get_analytics(_df: pd.DataFrame, mark: tuple, goal: float, as_of: str) -> dict:
+    # `_df` is not hashed; the data watermark (+ anchor month) is the cache key.
+    return fa.analyze(_df, goal, as_of=pd.Period(as_of, "M"))
+
+
+def _eta(months, when) -> str:
+    if months is None:
+        return "—"
+    return "reached" if months == 0 else f"{when} ({months} mo)"
 
 
 def insert_record(income: float, debt: float, savings: float) -> ObjectId:
@@ -94,7 +83,7 @@ with st.sidebar:
 
 # Load data
 docs = list(collection.find({}))
-df = _to_df(docs)
+df = fa.to_frame(docs)
 
 # Empty-state
 if df.empty:
@@ -117,6 +106,40 @@ col4.metric("Savings total", f"{total_savings:,.0f}")
 st.subheader("🎯 Goal progress")
 st.progress(progress, text=f"{total_savings:,.0f} / {goal_val:,.0f}")
 
+# ---------- Analytics ----------
+analytics = get_analytics(df, fa.watermark(df), goal_val, str(fa.current_month()))
+summary = analytics["summary"]
+monthly = analytics["monthly"]
+
+
+st.subheader("📊 Analytics")
+st.caption(
+    f"As of {summary['as_of']} · last record {summary['last_record_month'] or '—'} "
+    "(months without records count as no savings/paydown)"
+)
+a1, a2, a3, a4 = st.columns(4)
+a1.metric("Savings goal ETA", _eta(summary["savings_goal_months"], summary["savings_goal_eta"]))
+a2.metric("Debt-free ETA", _eta(summary["debt_free_months"], summary["debt_free_eta"]))
+if summary["debt_paid_pct"] is not None:
+    a3.metric("Debt paid", f"{summary['debt_paid_pct']:.0%}")
+if summary["income_goal_ratio"] is not None:
+    a4.metric("Income vs goal (avg)", f"{summary['income_goal_ratio']:.0%}")
+
+if not monthly.empty:
+    fig_m, ax_m = plt.subplots()
+    x = monthly.index.to_timestamp()
+    ax_m.bar(x, monthly["income"], width=20, alpha=0.3, label="income")
+    ax_m.plot(x, monthly["income_avg"], marker="o", label="income (rolling avg)")
+    ax_m.plot(x, monthly["savings_avg"], marker="o", label="savings (rolling avg)")
+    ax_m.plot(x, monthly["debt"], marker="o", label="debt")
+    proj = analytics["projection"]
+    ax_m.plot(proj.index.to_timestamp(), proj["debt"], linestyle="--", label="debt (projected)")
+    ax_m.set_ylabel("Amount")
+    ax_m.grid(True, alpha=0.3)
+    ax_m.legend()
+    st.pyplot(fig_m, clear_figure=True)
+    st.dataframe(monthly.tail(12), use_container_width=True)
+
 # ---------- Chart ----------
 st.subheader("📈 Time series")
 fig, ax = plt.subplots()
@@ -0,0 +1,79 @@
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from settings import settings
+
+
+class ETagCache:
+    """Per-owner cache of the last ETag/Last-Modified served for a read.
+
+    Entries are keyed by owner and then by view (``list:<skip>:<limit>``,
+    ``doc:<pid>``). Writes in this process drop the whole owner bucket.
+    Each worker has its own cache, so a write on another worker can be
+    answered with a stale 304 for up to ``ttl`` seconds; keep it short.
+
+    Readers take ``generation(owner)`` before querying Mongo and pass it to
+    ``put``; if a write invalidated the owner meanwhile, the put is dropped so
+    a pre-write ETag is never cached.
+    """
+
+    def __init__(self, ttl: float, max_owners: int):
+        self.ttl = ttl
+        self.max_owners = max_owners
+        self._owners: "OrderedDict[str, dict]" = OrderedDict()
+        self._generations: "OrderedDict[str, int]" = OrderedDict()
+        self._seq = 0
+        # Generation of owners not tracked (any more); raised on eviction so an
+        # evicted owner never looks unchanged to a reader that started earlier.
+        self._floor = 0
+
+    def generation(self, owner: str) -> int:
+        return self._generations.get(owner, self._floor)
+
+    def get(self, owner: str, key: str) -> tuple[str, datetime | None] | None:
+        bucket = self._owners.get(owner)
+        if bucket is None or self.ttl <= 0:
+            return None
+        entry = bucket.get(key)
+        if entry is None:
+            return None
+        etag, last_modified, stored_at = entry
+        if time.monotonic() - stored_at > self.ttl:
+            bucket.pop(key, None)
+            return None
+        self._owners.move_to_end(owner)
+        return etag, last_modified
+
+    def put(
+        self,
+        owner: str,
+        key: str,
+        etag: str,
+        last_modified: datetime | None,
+        generation: int,
+    ):
+        if generation != self.generation(owner):
+            return
+        bucket = self._owners.setdefault(owner, {})
+        bucket[key] = (etag, last_modified, time.monotonic())
+        self._owners.move_to_end(owner)
+        while len(self._owners) > self.max_owners:
+            self._owners.popitem(last=False)
+
+    def invalidate(self, owner: str):
+        self._owners.pop(owner, None)
+        self._seq += 1
+        self._generations[owner] = self._seq
+        self._generations.move_to_end(owner)
+        while len(self._generations) > self.max_owners:
+            self._generations.popitem(last=False)
+            self._floor = self._seq
+
+    def clear(self):
+        self._owners.clear()
+        self._generations.clear()
+        self._floor = self._seq
+
+
+project_etags = ETagCache(settings.ETAG_CACHE_TTL_SEC, settings.ETAG_CACHE_MAX_OWNERS)
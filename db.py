@@ -1,6 +1,15 @@
+import asyncio
+import logging
+
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import OperationFailure
 from settings import settings
 
+log = logging.getLogger("proplus.db")
+
+# Each worker process owns its client: connect_db() runs from the app lifespan,
+# i.e. after the server has forked, so nothing here is shared between workers.
 db: AsyncIOMotorDatabase | None = None
 _client: AsyncIOMotorClient | None = None
 
@@ -9,10 +18,45 @@ async def connect_db():
     global db, _client
     if db is not None:
         return
-    _client = AsyncIOMotorClient(settings.MONGO_URL)
+    _client = AsyncIOMotorClient(
+        settings.MONGO_URL,
+        minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+        maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+        serverSelectionTimeoutMS=settings.MONGO_TIMEOUT_MS,
+    )
     db = _client[settings.MONGO_DB]
 
 
+async def warm_pool():
+    """Open pool connections up front so the first requests don't pay for them."""
+    if db is None:
+        return
+    n = max(settings.MONGO_MIN_POOL_SIZE, 1)
+    await asyncio.gather(*(db.command("ping") for _ in range(n)))
+
+
+INDEXES = [
+    ("users", [("email", ASCENDING)], {"unique": True}),
+    ("projects", [("owner_id", ASCENDING), ("created_at", DESCENDING)], {}),
+    ("jobs", [("name", ASCENDING), ("created_at", DESCENDING)], {}),
+]
+
+
+async def ensure_indexes():
+    """Create INDEXES; connection errors propagate so the caller can retry.
+
+    An index Mongo refuses to build (e.g. duplicate emails blocking the unique
+    index) is logged and skipped: the app ran without it before.
+    """
+    if db is None:
+        return
+    for coll, keys, opts in INDEXES:
+        try:
+            await db[coll].create_index(keys, **opts)
+        except OperationFailure as e:
+            log.error("could not create index %s on %s: %s", keys, coll, e)
+
+
 async def close_db():
     global db, _client
     if _client:
@@ -0,0 +1,59 @@
+from collections import OrderedDict
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from starlette.concurrency import run_in_threadpool
+
+import db as dbmod
+from auth import require_admin
+from automation import finance_analytics as fa
+from settings import settings
+
+router = APIRouter(prefix="/finance", tags=["finance"])
+
+# Recently computed payloads per (watermark, month, params), LRU-capped.
+# Finance records are append-only, so an unchanged watermark (within the
+# same anchor month) means unchanged analytics.
+_CACHE_SIZE = 8
+_cache: "OrderedDict[tuple, dict]" = OrderedDict()
+
+
+async def _watermark(col) -> str:
+    # Newest _id only: an indexed lookup, and records are append-only.
+    last = await col.find_one({}, {"_id": 1}, sort=[("_id", -1)])
+    return str(last["_id"]) if last else ""
+
+
+def _compute(docs: list[dict], window: int, horizon: int, as_of) -> dict:
+    df = fa.to_frame(docs)
+    result = fa.analyze(
+        df, settings.SAVINGS_GOAL, window=window, horizon=horizon, as_of=as_of
+    )
+    return fa.to_payload(result)
+
+
+@router.get("/analytics")
+async def analytics(
+    user=Depends(require_admin),
+    window: int = Query(3, ge=1, le=24),
+    horizon: int = Query(24, ge=1, le=120),
+):
+    if dbmod.db is None:
+        raise HTTPException(503, "DB not ready")
+    col = dbmod.db[settings.FINANCE_COLLECTION]
+    mark = await _watermark(col)
+    as_of = fa.current_month()
+    key = (mark, str(as_of), window, horizon)
+    if key in _cache:
+        _cache.move_to_end(key)
+        return _cache[key]
+
+    docs = await col.find(
+        {}, {"_id": 1, "ts": 1, "income": 1, "debt": 1, "savings": 1}
+    ).to_list(None)
+    payload = await run_in_threadpool(_compute, docs, window, horizon, as_of)
+    for stale in [k for k in _cache if k[:2] != key[:2]]:
+        del _cache[stale]
+    _cache[key] = payload
+    while len(_cache) > _CACHE_SIZE:
+        _cache.popitem(last=False)
+    return payload
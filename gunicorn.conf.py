@@ -0,0 +1,20 @@
+# Production server: gunicorn process manager + uvicorn workers.
+# Every worker runs the app lifespan itself (preload_app is off), so each one
+# gets its own Motor client, connection pool and in-process caches.
+import multiprocessing
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = False
+
+# Graceful drain: on SIGTERM workers stop accepting, finish in-flight requests
+# for up to graceful_timeout seconds, then run the lifespan shutdown.
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.getenv("WORKER_TIMEOUT", "60"))
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info")
@@ -1,4 +1,7 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
+from pymongo.errors import PyMongoError
+
+import db as dbmod
 
 router = APIRouter()
 
@@ -6,3 +9,16 @@ router = APIRouter()
 @router.get("/healthz")
 def healthz():
     return {"status": "ok"}
+
+
+@router.get("/readyz")
+async def readyz(request: Request, response: Response):
+    if not getattr(request.app.state, "ready", False) or dbmod.db is None:
+        response.status_code = 503
+        return {"status": "starting"}
+    try:
+        await dbmod.db.command("ping")
+    except PyMongoError:
+        response.status_code = 503
+        return {"status": "db unavailable"}
+    return {"status": "ready"}
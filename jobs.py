@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+import db as dbmod
+from auth import require_admin
+from scheduler import parse_day, scheduler
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@router.get("")
+async def list_jobs(
+    user=Depends(require_admin),
+    name: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+):
+    if dbmod.db is None:
+        raise HTTPException(503, "DB not ready")
+    query = {"name": name} if name else {}
+    cur = dbmod.db.jobs.find(query).sort("created_at", -1).limit(limit)
+    return [{**d, "_id": str(d["_id"])} async for d in cur]
+
+
+@router.post("/{name}/run")
+async def run_job(
+    name: str,
+    user=Depends(require_admin),
+    period: Optional[str] = None,
+    force: bool = False,
+):
+    if dbmod.db is None:
+        raise HTTPException(503, "DB not ready")
+    if name not in scheduler.jobs:
+        raise HTTPException(404, "Unknown job")
+    period = period or datetime.utcnow().strftime("%Y-%m-%d")
+    try:
+        parse_day(period)
+    except ValueError as e:
+        raise HTTPException(422, str(e))
+    if force and not await scheduler.reset(name, period, by=user["email"]):
+        raise HTTPException(429, "Re-run refused: job still leased or forced too recently")
+    scheduler.submit(name, period)
+    return {"ok": True, "id": f"{name}:{period}"}
@@ -1,28 +1,94 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from pymongo.errors import PyMongoError
 
-from db import connect_db, close_db
+from db import connect_db, close_db, ensure_indexes, warm_pool
+from cache import project_etags
 from health import router as health_router
 from auth import router as auth_router
 from projects import router as projects_router
+from finance import router as finance_router
+from jobs import router as jobs_router
+from scheduler import scheduler, daily_at
+import report_jobs
+from settings import settings
+
+log = logging.getLogger("proplus")
+
+scheduler.register(
+    "finance_report",
+    report_jobs.finance_report,
+    daily_at(settings.SCHEDULER_REPORT_HOUR),
+)
+
 
-app = FastAPI(title="ProPlus")
+async def _warm_up(app: FastAPI):
+    """Warm the pool and ensure indexes, retrying until Mongo is reachable.
 
+    Runs in the background so the worker serves requests (503s from /readyz
+    and DB-backed routes) instead of failing to boot while Mongo is down.
+    """
+    delay = 1
+    while True:
+        try:
+            await warm_pool()
+            await ensure_indexes()
+            break
+        except PyMongoError as e:
+            log.warning("startup warm-up failed (%s); retrying in %ss", e, delay)
+        except Exception:
+            log.exception("startup warm-up crashed; retrying in %ss", delay)
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 30)
+    if settings.SCHEDULER_ENABLED:
+        await scheduler.start()
+    app.state.ready = True
 
-@app.on_event("startup")
-async def on_start():
+
+def _log_warm_up_failure(task: asyncio.Task):
+    # Anything escaping _warm_up (e.g. scheduler.start) would otherwise leave
+    # the worker not-ready forever without a trace in the log.
+    if not task.cancelled() and task.exception() is not None:
+        log.error("startup warm-up task died", exc_info=task.exception())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Runs once per worker process; /readyz stays 503 until _warm_up finishes.
+    app.state.ready = False
     await connect_db()
+    project_etags.clear()
+    warm_up = asyncio.create_task(_warm_up(app))
+    warm_up.add_done_callback(_log_warm_up_failure)
+    try:
+        yield
+    finally:
+        # The server has stopped accepting connections and drained in-flight
+        # requests by the time we get here; mark not-ready before closing.
+        app.state.ready = False
+        warm_up.cancel()
+        await scheduler.stop()
+        await close_db()
+
 
+def create_app() -> FastAPI:
+    app = FastAPI(title="ProPlus", lifespan=lifespan)
+    app.state.ready = False
 
-@app.on_event("shutdown")
-async def on_stop():
-    await close_db()
+    app.include_router(health_router)  # /healthz, /readyz
+    app.include_router(auth_router)
+    app.include_router(projects_router)  # /projects
+    app.include_router(finance_router)  # /finance/analytics
+    app.include_router(jobs_router)  # /jobs
 
+    @app.get("/")
+    def root():
+        return {"status": "ok", "app": "ProPlus"}
 
-app.include_router(health_router)  # /healthz
-app.include_router(auth_router)
-app.include_router(projects_router)  # /projects
+    return app
 
 
-@app.get("/")
-def root():
-    return {"status": "ok", "app": "ProPlus"}
+app = create_app()
@@ -31,3 +31,5 @@ class ProjectOut(BaseModel):
     description: Optional[str] = None
     owner_id: str
     created_at: datetime
+    updated_at: Optional[datetime] = None
+    version: int = 0
@@ -1,11 +1,14 @@
-from datetime import datetime
-from typing import List
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import List, Optional
 
 from bson import ObjectId
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from pymongo import ReturnDocument
 
 import db as dbmod
+from cache import project_etags
 from models import ProjectIn, ProjectOut
 from auth import get_current_user  # auth.py-ում արդեն ունենք
 
@@ -19,30 +22,104 @@ def _to_out(d: dict) -> ProjectOut:
         "description": d.get("description"),
         "owner_id": str(d["owner_id"]),
         "created_at": d["created_at"],
+        "updated_at": d.get("updated_at", d["created_at"]),
+        "version": d.get("version", 0),
     }
 
 
+# --------- Conditional request helpers ---------
+def _doc_etag(d: dict) -> str:
+    return f'"{d["_id"]}-{d.get("version", 0)}"'
+
+
+def _list_etag(docs: list[dict]) -> str:
+    h = hashlib.sha1()
+    for d in docs:
+        h.update(f'{d["_id"]}:{d.get("version", 0)};'.encode())
+    return f'"{h.hexdigest()[:20]}"'
+
+
+def _parse_etags(header: Optional[str], weak: bool = True) -> list[str]:
+    """Entity tags from If-None-Match (weak=True, weak comparison) or
+    If-Match (weak=False: strong comparison, weak tags never match)."""
+    if not header:
+        return []
+    tags = []
+    for part in header.split(","):
+        part = part.strip()
+        if part.startswith("W/"):
+            if not weak:
+                continue
+            part = part[2:]
+        if part:
+            tags.append(part)
+    return tags
+
+
+def _etag_matches(etag: str, header: Optional[str]) -> bool:
+    tags = _parse_etags(header)
+    return "*" in tags or etag in tags
+
+
+def _version_from_etag(pid: str, etag: str) -> Optional[int]:
+    prefix, _, version = etag.strip('"').rpartition("-")
+    if prefix != pid or not version.isdigit():
+        return None
+    return int(version)
+
+
+def _set_cache_headers(response: Response, etag: str, last_modified: Optional[datetime]):
+    response.headers["ETag"] = etag
+    # Always revalidate: the ETag check is cheap, stale project data is not.
+    response.headers["Cache-Control"] = "private, no-cache"
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(
+            last_modified.replace(tzinfo=timezone.utc), usegmt=True
+        )
+
+
+def _not_modified(etag: str, last_modified: Optional[datetime]) -> Response:
+    response = Response(status_code=304)
+    _set_cache_headers(response, etag, last_modified)
+    return response
+
+
 @router.post("", response_model=ProjectOut)
-async def create_project(data: ProjectIn, user=Depends(get_current_user)):
+async def create_project(
+    data: ProjectIn, response: Response, user=Depends(get_current_user)
+):
     if dbmod.db is None:
         raise HTTPException(503, "DB not ready")
+    now = datetime.utcnow()
     doc = {
         "title": data.title,
         "description": data.description,
         "owner_id": ObjectId(user["_id"]),
-        "created_at": datetime.utcnow(),
+        "created_at": now,
+        "updated_at": now,
+        "version": 1,
     }
     res = await dbmod.db.projects.insert_one(doc)
     doc["_id"] = res.inserted_id
+    project_etags.invalidate(user["_id"])
+    _set_cache_headers(response, _doc_etag(doc), doc["updated_at"])
     return _to_out(doc)
 
 
 @router.get("", response_model=List[ProjectOut])
 async def list_projects(
+    response: Response,
     user=Depends(get_current_user),
     limit: int = Query(20, ge=1, le=100),
     skip: int = Query(0, ge=0),
+    if_none_match: Optional[str] = Header(None),
 ):
+    key = f"list:{skip}:{limit}"
+    generation = project_etags.generation(user["_id"])
+    cached = project_etags.get(user["_id"], key)
+    if cached and _etag_matches(cached[0], if_none_match):
+        return _not_modified(*cached)
+
     if dbmod.db is None:
         raise HTTPException(503, "DB not ready")
     cur = (
@@ -51,11 +128,31 @@ async def list_projects(
         .limit(limit)
         .sort("created_at", -1)
     )
-    return [_to_out(d) async for d in cur]
+    docs = [d async for d in cur]
+    etag = _list_etag(docs)
+    last_modified = max(
+        (d.get("updated_at", d["created_at"]) for d in docs), default=None
+    )
+    project_etags.put(user["_id"], key, etag, last_modified, generation)
+    if _etag_matches(etag, if_none_match):
+        return _not_modified(etag, last_modified)
+    _set_cache_headers(response, etag, last_modified)
+    return [_to_out(d) for d in docs]
 
 
 @router.get("/{pid}", response_model=ProjectOut)
-async def get_project(pid: str, user=Depends(get_current_user)):
+async def get_project(
+    pid: str,
+    response: Response,
+    user=Depends(get_current_user),
+    if_none_match: Optional[str] = Header(None),
+):
+    key = f"doc:{pid}"
+    generation = project_etags.generation(user["_id"])
+    cached = project_etags.get(user["_id"], key)
+    if cached and _etag_matches(cached[0], if_none_match):
+        return _not_modified(*cached)
+
     if dbmod.db is None:
         raise HTTPException(503, "DB not ready")
     doc = await dbmod.db.projects.find_one(
@@ -63,20 +160,57 @@ async def get_project(pid: str, user=Depends(get_current_user)):
     )
     if not doc:
         raise HTTPException(404, "Not found")
+    etag = _doc_etag(doc)
+    last_modified = doc.get("updated_at", doc["created_at"])
+    project_etags.put(user["_id"], key, etag, last_modified, generation)
+    if _etag_matches(etag, if_none_match):
+        return _not_modified(etag, last_modified)
+    _set_cache_headers(response, etag, last_modified)
     return _to_out(doc)
 
 
 @router.put("/{pid}", response_model=ProjectOut)
-async def update_project(pid: str, data: ProjectIn, user=Depends(get_current_user)):
+async def update_project(
+    pid: str,
+    data: ProjectIn,
+    response: Response,
+    user=Depends(get_current_user),
+    if_match: Optional[str] = Header(None),
+):
     if dbmod.db is None:
         raise HTTPException(503, "DB not ready")
+    query = {"_id": ObjectId(pid), "owner_id": ObjectId(user["_id"])}
+    tags = _parse_etags(if_match, weak=False)
+    if if_match and not tags:
+        # Only weak tags were sent; they never satisfy If-Match.
+        raise HTTPException(412, "Precondition failed")
+    if tags and "*" not in tags:
+        # Optimistic concurrency: the version is part of the filter, so a stale
+        # ETag simply fails to match and no extra read is needed.
+        versions = [v for v in (_version_from_etag(pid, t) for t in tags) if v is not None]
+        if not versions:
+            raise HTTPException(412, "Precondition failed")
+        query["$or"] = [
+            {"version": v} if v else {"version": {"$exists": False}} for v in versions
+        ]
     res = await dbmod.db.projects.find_one_and_update(
-        {"_id": ObjectId(pid), "owner_id": ObjectId(user["_id"])},
-        {"$set": {"title": data.title, "description": data.description}},
+        query,
+        {
+            "$set": {
+                "title": data.title,
+                "description": data.description,
+                "updated_at": datetime.utcnow(),
+            },
+            "$inc": {"version": 1},
+        },
         return_document=ReturnDocument.AFTER,
     )
     if not res:
+        if tags:
+            raise HTTPException(412, "Precondition failed")
         raise HTTPException(404, "Not found")
+    project_etags.invalidate(user["_id"])
+    _set_cache_headers(response, _doc_etag(res), res["updated_at"])
     return _to_out(res)
 
 
@@ -89,4 +223,5 @@ async def delete_project(pid: str, user=Depends(get_current_user)):
     )
     if r.deleted_count == 0:
         raise HTTPException(404, "Not found")
+    project_etags.invalidate(user["_id"])
     return {"ok": True}
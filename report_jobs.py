@@ -0,0 +1,74 @@
+from datetime import datetime, time, timedelta
+from pathlib import Path
+
+import pandas as pd
+from anyio import from_thread
+from matplotlib.figure import Figure
+from starlette.concurrency import run_in_threadpool
+
+import db as dbmod
+from automation import finance_analytics as fa
+from automation import send_report
+from automation.generate_report import build_pdf
+from scheduler import StageTimer, parse_day
+from settings import settings
+
+
+def _render(docs: list[dict], png: Path, as_of: pd.Period) -> dict:
+    df = fa.to_frame(docs)
+    summary = fa.analyze(df, settings.SAVINGS_GOAL, as_of=as_of)["summary"]
+
+    # Figure (not pyplot) keeps rendering thread-safe inside the threadpool.
+    fig = Figure(figsize=(8, 5))
+    ax = fig.subplots()
+    if df.empty:
+        ax.text(0.5, 0.5, "No finance records yet", ha="center", va="center")
+    else:
+        for col in fa.NUMERIC_COLS:
+            ax.plot(df["ts"], df[col], marker="o", label=col)
+        ax.legend()
+    ax.grid(True)
+    fig.tight_layout()
+    png.parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(png)
+    return summary
+
+
+def _send(period: str, files: list[Path], timer: StageTimer):
+    if not send_report.EMAIL_TO:
+        return
+    msg = send_report.build_message(files, subject=f"Finance Report – {period}")
+    # Mark the side effect only once SMTP login succeeded: connect/auth
+    # failures stay retryable, a failure while handing over the message is not.
+    send_report.send_message(
+        msg, before_send=lambda: from_thread.run(timer.mark_side_effect, "send")
+    )
+
+
+async def finance_report(period: str, timer: StageTimer):
+    """query → render (PNG) → PDF → email, one file set per period.
+
+    Only records up to the end of the period's day are included, so a re-run
+    for a past day reproduces that day's report.
+    """
+    day = parse_day(period)
+    until = datetime.combine(day, time()) + timedelta(days=1)
+    out = Path(settings.REPORTS_DIR)
+    png = out / f"finance_report_{period}.png"
+    pdf = out / f"finance_report_{period}.pdf"
+
+    with timer.stage("query"):
+        docs = await dbmod.db[settings.FINANCE_COLLECTION].find(
+            {"ts": {"$lt": until}}, {"_id": 1, "ts": 1, "income": 1, "debt": 1, "savings": 1}
+        ).to_list(None)
+    with timer.stage("render"):
+        summary = await run_in_threadpool(_render, docs, png, pd.Period(day, "M"))
+    with timer.stage("pdf"):
+        goal_block = {
+            "goal": summary["savings_goal"],
+            "progress": summary["savings_progress"],
+            "eta": summary["savings_goal_eta"],
+        }
+        await run_in_threadpool(build_pdf, summary, png, pdf, goal_block)
+    with timer.stage("send"):
+        await run_in_threadpool(_send, period, [pdf, png], timer)
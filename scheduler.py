@@ -0,0 +1,247 @@
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from typing import Awaitable, Callable, Optional
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+import db as dbmod
+from settings import settings
+
+log = logging.getLogger("proplus.scheduler")
+
+# A job run is identified by (name, period), e.g. ("finance_report", "2025-10-19").
+# Its Mongo document (`jobs` collection, _id "<name>:<period>") is the claim
+# token: only one worker/process can move it to "running", and a "done" run is
+# never repeated, so every worker may run the scheduler loop safely.
+# Once a job marks a side effect as started (mark_side_effect, e.g. before
+# sending email) the run is never retried automatically, only via reset().
+
+
+class StageTimer:
+    """Collects per-stage wall-clock durations (seconds) for one job run."""
+
+    def __init__(self, key: str = ""):
+        self.key = key
+        self.side_effect: str | None = None
+        self.timings: dict[str, float] = {}
+
+    async def mark_side_effect(self, stage: str):
+        """Record that a non-idempotent stage has begun; disables auto-retry."""
+        self.side_effect = stage
+        await dbmod.db.jobs.update_one(
+            {"_id": self.key},
+            {"$set": {"side_effect": stage, "side_effect_started_at": datetime.utcnow()}},
+        )
+
+    @contextmanager
+    def stage(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = round(time.perf_counter() - t0, 4)
+
+
+JobFn = Callable[[str, StageTimer], Awaitable[None]]
+PeriodFn = Callable[[datetime], Optional[str]]
+
+
+def daily_at(hour: int) -> PeriodFn:
+    """Period key for a daily job: today's date once `hour` (UTC) has passed."""
+
+    def period(now: datetime) -> Optional[str]:
+        return now.strftime("%Y-%m-%d") if now.hour >= hour else None
+
+    return period
+
+
+def parse_day(period: str) -> date:
+    """Validate a daily period key; raises ValueError unless it is a past or
+    current "YYYY-MM-DD" date (UTC)."""
+    day = date.fromisoformat(period)
+    if day.isoformat() != period:
+        raise ValueError(f"period must be YYYY-MM-DD, got {period!r}")
+    if day > datetime.utcnow().date():
+        raise ValueError(f"period {period} is in the future")
+    return day
+
+
+class Scheduler:
+    def __init__(self):
+        self.jobs: dict[str, tuple[JobFn, PeriodFn]] = {}
+        self._loop_task: asyncio.Task | None = None
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._sem = asyncio.Semaphore(settings.SCHEDULER_CONCURRENCY)
+
+    def register(self, name: str, run: JobFn, period: PeriodFn):
+        self.jobs[name] = (run, period)
+
+    # --------- Lifecycle ---------
+    async def start(self):
+        self._loop_task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        if self._loop_task:
+            self._loop_task.cancel()
+            try:
+                await self._loop_task
+            except asyncio.CancelledError:
+                pass
+            self._loop_task = None
+        # Let running jobs finish (each is bounded by JOB_TIMEOUT_SEC).
+        if self._inflight:
+            await asyncio.gather(*list(self._inflight.values()), return_exceptions=True)
+
+    async def _loop(self):
+        while True:
+            now = datetime.utcnow()
+            for name, (_, period_fn) in self.jobs.items():
+                period = period_fn(now)
+                if period:
+                    self.submit(name, period)
+            await asyncio.sleep(settings.SCHEDULER_TICK_SEC)
+
+    # --------- Execution ---------
+    def submit(self, name: str, period: str) -> asyncio.Task:
+        key = f"{name}:{period}"
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run(name, period))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return task
+
+    async def _claim(self, key: str, name: str, period: str) -> dict | None:
+        now = datetime.utcnow()
+        lease = timedelta(seconds=settings.JOB_TIMEOUT_SEC + 60)
+        try:
+            doc = await dbmod.db.jobs.find_one_and_update(
+                {
+                    "_id": key,
+                    "side_effect_started_at": {"$exists": False},
+                    "$or": [
+                        {
+                            "status": "failed",
+                            "attempts": {"$lt": settings.JOB_MAX_ATTEMPTS},
+                            "next_run_at": {"$lte": now},
+                        },
+                        # Lease expired: the worker that held it is gone.
+                        {"status": "running", "lease_until": {"$lt": now}},
+                        # Timed out: threadpool work may still be running
+                        # until the lease it was claimed with expires.
+                        {
+                            "status": "timeout",
+                            "attempts": {"$lt": settings.JOB_MAX_ATTEMPTS},
+                            "lease_until": {"$lt": now},
+                            "next_run_at": {"$lte": now},
+                        },
+                    ],
+                },
+                {
+                    "$set": {
+                        "name": name,
+                        "period": period,
+                        "status": "running",
+                        "started_at": now,
+                        "lease_until": now + lease,
+                        "error": None,
+                    },
+                    "$inc": {"attempts": 1},
+                    "$setOnInsert": {"created_at": now},
+                },
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            # Already done, running elsewhere, out of attempts, backing off
+            # or past a side effect.
+            return None
+        return doc
+
+    async def _run(self, name: str, period: str):
+        if dbmod.db is None:
+            return
+        run, _ = self.jobs[name]
+        key = f"{name}:{period}"
+        async with self._sem:
+            claimed = await self._claim(key, name, period)
+            if claimed is None:
+                return
+            timer = StageTimer(key)
+            t0 = time.perf_counter()
+            update = {"status": "done", "error": None}
+            try:
+                await asyncio.wait_for(run(period, timer), settings.JOB_TIMEOUT_SEC)
+            except asyncio.TimeoutError:
+                # Sync stages keep running in the threadpool after the timeout;
+                # "timeout" runs keep their lease, so no retry starts before it ends.
+                error = f"timeout after {settings.JOB_TIMEOUT_SEC}s"
+                update = {"status": "timeout", "error": error}
+            except Exception as e:
+                log.exception("job %s failed", key)
+                update = {"status": "failed", "error": repr(e)}
+
+            now = datetime.utcnow()
+            if update["status"] != "timeout":
+                update["lease_until"] = now  # release; a timed-out run keeps its lease
+            if update["status"] != "done" and timer.side_effect:
+                update["error"] += f" (not retried: {timer.side_effect} already started)"
+            backoff = settings.JOB_RETRY_BACKOFF_SEC * 2 ** (claimed["attempts"] - 1)
+            update.update(
+                {
+                    "finished_at": now,
+                    "duration": round(time.perf_counter() - t0, 4),
+                    "timings": timer.timings,
+                    "next_run_at": now + timedelta(seconds=backoff),
+                }
+            )
+            await dbmod.db.jobs.update_one({"_id": key}, {"$set": update})
+
+            slowest = max(timer.timings.items(), key=lambda kv: kv[1], default=None)
+            log.info(
+                "job %s %s in %.2fs (slowest stage: %s) %s",
+                key, update["status"], update["duration"], slowest, timer.timings,
+            )
+
+    async def reset(self, name: str, period: str, by: str) -> bool:
+        """Make a finished run claimable again (manual re-run).
+
+        Refused while the run holds its lease or when the previous forced
+        re-run was less than JOB_FORCE_MIN_INTERVAL_SEC ago. Each reset is
+        appended to the run's `reruns` audit list.
+        """
+        now = datetime.utcnow()
+        key = f"{name}:{period}"
+        res = await dbmod.db.jobs.update_one(
+            {
+                "_id": key,
+                "lease_until": {"$lt": now},
+                "last_forced_at": {
+                    "$not": {
+                        "$gt": now - timedelta(seconds=settings.JOB_FORCE_MIN_INTERVAL_SEC)
+                    }
+                },
+            },
+            {
+                "$set": {
+                    "status": "failed",
+                    "attempts": 0,
+                    "next_run_at": now,
+                    "last_forced_at": now,
+                },
+                "$unset": {"side_effect": "", "side_effect_started_at": ""},
+                "$push": {"reruns": {"by": by, "at": now}},
+            },
+        )
+        if res.matched_count:
+            log.warning("job %s reset for re-run by %s", key, by)
+            return True
+        # Nothing to reset if the run does not exist yet.
+        return await dbmod.db.jobs.count_documents({"_id": key}, limit=1) == 0
+
+
+scheduler = Scheduler()
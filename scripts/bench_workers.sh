@@ -0,0 +1,76 @@
+#!/usr/bin/env bash
+# Throughput vs. worker count for the production server (gunicorn.conf.py).
+# Needs `wrk`, `curl` and a reachable Mongo (MONGO_URL). It benchmarks the
+# DB-backed GET /projects as a throwaway bench user, in a separate database
+# (BENCH_MONGO_DB, default proplus_bench) so the real one is never touched.
+# Example:
+#   scripts/bench_workers.sh "1 2 4 8"
+#   BENCH_PATH=/projects?limit=100 scripts/bench_workers.sh
+set -euo pipefail
+
+WORKERS_LIST="${1:-1 2 4}"
+PORT="${PORT:-8099}"
+BENCH_PATH="${BENCH_PATH:-/projects}"
+DURATION="${DURATION:-15s}"
+CONNECTIONS="${CONNECTIONS:-128}"
+THREADS="${THREADS:-4}"
+BENCH_EMAIL="${BENCH_EMAIL:-bench@example.com}"
+BENCH_PASS="${BENCH_PASS:-bench-password}"
+BASE="http://127.0.0.1:$PORT"
+export MONGO_DB="${BENCH_MONGO_DB:-proplus_bench}"
+case "$MONGO_DB" in
+  *bench*) ;;
+  *) echo "❌ refusing to benchmark against MONGO_DB=$MONGO_DB (name must contain 'bench')" >&2
+     exit 2 ;;
+esac
+
+srv=""
+trap '[ -n "$srv" ] && kill -TERM "$srv" 2>/dev/null || true' EXIT
+
+wait_ready() {
+  until curl -fsS "$BASE/readyz" >/dev/null 2>&1; do
+    if ! kill -0 "$srv" 2>/dev/null; then
+      echo "❌ gunicorn exited before becoming ready" >&2
+      exit 1
+    fi
+    sleep 0.2
+  done
+}
+
+get_token() {
+  curl -s -X POST "$BASE/auth/register" -H 'Content-Type: application/json' \
+    -d "{\"email\":\"$BENCH_EMAIL\",\"password\":\"$BENCH_PASS\"}" >/dev/null
+  curl -s -X POST "$BASE/auth/login" -H 'Content-Type: application/json' \
+    -d "{\"email\":\"$BENCH_EMAIL\",\"password\":\"$BENCH_PASS\"}" \
+    | awk -F'"' '/access_token/{print $4}'
+}
+
+printf '%-8s %12s %12s\n' workers req/s scaling
+base_rps=""
+for n in $WORKERS_LIST; do
+  WEB_CONCURRENCY="$n" BIND="127.0.0.1:$PORT" LOG_LEVEL=warning \
+    gunicorn -c gunicorn.conf.py --access-logfile /dev/null main:app &
+  srv=$!
+  wait_ready
+
+  TOKEN="${TOKEN:-$(get_token)}"
+  if [ -z "$TOKEN" ]; then
+    echo "❌ could not obtain a token for $BENCH_EMAIL" >&2
+    exit 1
+  fi
+  HDR=(-H "Authorization: Bearer $TOKEN")
+  if [ -z "$base_rps" ]; then
+    curl -s -X POST "$BASE/projects" "${HDR[@]}" -H 'Content-Type: application/json' \
+      -d '{"title":"bench","description":"bench_workers.sh"}' >/dev/null
+  fi
+
+  wrk -t"$THREADS" -c"$CONNECTIONS" -d2s "${HDR[@]}" "$BASE$BENCH_PATH" >/dev/null  # warm-up
+  rps=$(wrk -t"$THREADS" -c"$CONNECTIONS" -d"$DURATION" "${HDR[@]}" "$BASE$BENCH_PATH" \
+    | awk '/Requests\/sec/{print $2}')
+
+  kill -TERM "$srv"; wait "$srv" || true
+  srv=""
+
+  base_rps="${base_rps:-$rps}"
+  printf '%-8s %12.0f %11.2fx\n' "$n" "$rps" "$(echo "$rps / $base_rps" | bc -l)"
+done
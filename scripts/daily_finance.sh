@@ -11,11 +11,17 @@ SAVINGS="${3:-0}"
 # containers must be up
 docker compose up -d
 
-# 1) Add entry
+# Add entry
 make add income="$INCOME" debt="$DEBT" savings="$SAVINGS"
 
-# 2) Build report (PNG/PDF)
-make report
-
-# 3) Send email
-make email
+# With SCHEDULER_ENABLED=true (env or .env) the API's "finance_report" job builds
+# and emails the report (retried, once per day, timings in GET /jobs).
+# Otherwise keep doing it here.
+SCHEDULER_ENABLED="${SCHEDULER_ENABLED:-$(sed -n 's/^SCHEDULER_ENABLED=//p' .env 2>/dev/null | tail -1 || true)}"
+case "$(printf %s "$SCHEDULER_ENABLED" | tr "[:upper:]" "[:lower:]")" in
+  true|1|yes|on) echo "ℹ️ Report/email handled by the API scheduler" ;;
+  *)
+    make report
+    make email
+    ;;
+esac
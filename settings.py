@@ -4,8 +4,25 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     MONGO_URL: str = "mongodb://localhost:27017"
     MONGO_DB: str = "proplus"
+    MONGO_MIN_POOL_SIZE: int = 5
+    MONGO_MAX_POOL_SIZE: int = 100
+    MONGO_TIMEOUT_MS: int = 5000
+    FINANCE_COLLECTION: str = "finance"
+    SAVINGS_GOAL: float = 300000
+    REPORTS_DIR: str = "data_analytics/reports"
+    SCHEDULER_ENABLED: bool = False
+    SCHEDULER_TICK_SEC: int = 60
+    SCHEDULER_CONCURRENCY: int = 2
+    SCHEDULER_REPORT_HOUR: int = 8  # UTC
+    JOB_TIMEOUT_SEC: int = 300
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_RETRY_BACKOFF_SEC: int = 60
+    JOB_FORCE_MIN_INTERVAL_SEC: int = 3600
+    ADMIN_EMAILS: str = ""  # comma-separated; may read finance data and jobs
     JWT_SECRET: str = "change_me"
     JWT_EXPIRES_MIN: int = 60
+    ETAG_CACHE_TTL_SEC: int = 3
+    ETAG_CACHE_MAX_OWNERS: int = 1024
 
     class Config:
         env_file = ".env"
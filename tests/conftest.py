@@ -0,0 +1,16 @@
+import sys
+from pathlib import Path
+
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import db as dbmod  # noqa: E402
+
+
+@pytest.fixture
+def mongo():
+    dbmod.db = AsyncMongoMockClient()["proplus_test"]
+    yield dbmod.db
+    dbmod.db = None
@@ -0,0 +1,169 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from scheduler import Scheduler, parse_day
+from settings import settings
+
+KEY = "job:2025-01-01"
+
+
+@pytest.fixture(autouse=True)
+def fast_settings(monkeypatch):
+    monkeypatch.setattr(settings, "JOB_TIMEOUT_SEC", 5)
+    monkeypatch.setattr(settings, "JOB_MAX_ATTEMPTS", 3)
+    monkeypatch.setattr(settings, "JOB_RETRY_BACKOFF_SEC", 60)
+    monkeypatch.setattr(settings, "JOB_FORCE_MIN_INTERVAL_SEC", 3600)
+
+
+def make_scheduler(run):
+    s = Scheduler()
+    s.register("job", run, lambda now: None)
+    return s
+
+
+async def ok(period, timer):
+    with timer.stage("work"):
+        pass
+
+
+async def boom(period, timer):
+    raise RuntimeError("boom")
+
+
+def test_claim_missing_run_creates_it(mongo):
+    s = make_scheduler(ok)
+    doc = asyncio.run(s._claim(KEY, "job", "2025-01-01"))
+    assert doc["status"] == "running"
+    assert doc["attempts"] == 1
+    assert doc["lease_until"] > datetime.utcnow()
+
+
+def test_done_run_is_not_claimed_again(mongo):
+    calls = []
+
+    async def run(period, timer):
+        calls.append(period)
+
+    s = make_scheduler(run)
+
+    async def scenario():
+        await s._run("job", "2025-01-01")
+        await s._run("job", "2025-01-01")
+        return await mongo.jobs.find_one({"_id": KEY}), await s._claim(KEY, "job", "2025-01-01")
+
+    doc, claimed = asyncio.run(scenario())
+    assert calls == ["2025-01-01"]
+    assert doc["status"] == "done"
+    assert claimed is None
+
+
+def test_failed_run_waits_out_backoff(mongo):
+    s = make_scheduler(boom)
+
+    async def scenario():
+        await s._run("job", "2025-01-01")
+        doc = await mongo.jobs.find_one({"_id": KEY})
+        during_backoff = await s._claim(KEY, "job", "2025-01-01")
+        await mongo.jobs.update_one(
+            {"_id": KEY}, {"$set": {"next_run_at": datetime.utcnow() - timedelta(seconds=1)}}
+        )
+        after_backoff = await s._claim(KEY, "job", "2025-01-01")
+        return doc, during_backoff, after_backoff
+
+    doc, during_backoff, after_backoff = asyncio.run(scenario())
+    assert doc["status"] == "failed"
+    assert doc["next_run_at"] > datetime.utcnow() + timedelta(seconds=30)
+    assert during_backoff is None
+    assert after_backoff["attempts"] == 2
+
+
+def test_failed_run_stops_after_max_attempts(mongo):
+    s = make_scheduler(boom)
+
+    async def scenario():
+        for _ in range(settings.JOB_MAX_ATTEMPTS + 1):
+            await mongo.jobs.update_one(
+                {"_id": KEY}, {"$set": {"next_run_at": datetime.utcnow() - timedelta(seconds=1)}}
+            )
+            await s._run("job", "2025-01-01")
+        return await mongo.jobs.find_one({"_id": KEY})
+
+    doc = asyncio.run(scenario())
+    assert doc["attempts"] == settings.JOB_MAX_ATTEMPTS
+
+
+def test_timed_out_run_keeps_lease(mongo, monkeypatch):
+    monkeypatch.setattr(settings, "JOB_TIMEOUT_SEC", 0.05)
+
+    async def slow(period, timer):
+        await asyncio.sleep(1)
+
+    s = make_scheduler(slow)
+
+    async def scenario():
+        await s._run("job", "2025-01-01")
+        doc = await mongo.jobs.find_one({"_id": KEY})
+        past = datetime.utcnow() - timedelta(seconds=1)
+        await mongo.jobs.update_one({"_id": KEY}, {"$set": {"next_run_at": past}})
+        while_leased = await s._claim(KEY, "job", "2025-01-01")
+        await mongo.jobs.update_one({"_id": KEY}, {"$set": {"lease_until": past}})
+        after_lease = await s._claim(KEY, "job", "2025-01-01")
+        return doc, while_leased, after_lease
+
+    doc, while_leased, after_lease = asyncio.run(scenario())
+    assert doc["status"] == "timeout"
+    assert doc["lease_until"] > datetime.utcnow()
+    assert while_leased is None
+    assert after_lease["attempts"] == 2
+
+
+def test_run_is_not_retried_after_side_effect(mongo):
+    async def fails_mid_send(period, timer):
+        await timer.mark_side_effect("send")
+        raise ConnectionError("lost connection during DATA")
+
+    s = make_scheduler(fails_mid_send)
+
+    async def scenario():
+        await s._run("job", "2025-01-01")
+        await mongo.jobs.update_one(
+            {"_id": KEY}, {"$set": {"next_run_at": datetime.utcnow() - timedelta(seconds=1)}}
+        )
+        return await mongo.jobs.find_one({"_id": KEY}), await s._claim(KEY, "job", "2025-01-01")
+
+    doc, claimed = asyncio.run(scenario())
+    assert doc["status"] == "failed"
+    assert "not retried" in doc["error"]
+    assert claimed is None
+
+
+def test_force_refused_while_leased_and_rate_limited(mongo):
+    s = make_scheduler(ok)
+
+    async def scenario():
+        await s._claim(KEY, "job", "2025-01-01")  # running, lease held
+        while_running = await s.reset("job", "2025-01-01", by="admin@example.com")
+        await mongo.jobs.update_one(
+            {"_id": KEY},
+            {"$set": {"status": "done", "lease_until": datetime.utcnow() - timedelta(seconds=1)}},
+        )
+        first = await s.reset("job", "2025-01-01", by="admin@example.com")
+        await mongo.jobs.update_one({"_id": KEY}, {"$set": {"status": "done"}})
+        second = await s.reset("job", "2025-01-01", by="admin@example.com")
+        return while_running, first, second, await mongo.jobs.find_one({"_id": KEY})
+
+    while_running, first, second, doc = asyncio.run(scenario())
+    assert while_running is False
+    assert first is True
+    assert second is False
+    assert [r["by"] for r in doc["reruns"]] == ["admin@example.com"]
+
+
+def test_parse_day_rejects_bad_and_future_periods():
+    assert parse_day("2025-01-01").isoformat() == "2025-01-01"
+    future = (datetime.utcnow() + timedelta(days=2)).strftime("%Y-%m-%d")
+    for bad in ["../../etc", "2025-1-1", future]:
+        with pytest.raises(ValueError):
+            parse_day(bad)